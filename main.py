@@ -8,7 +8,16 @@ import yfinance as yf
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import time
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, fields
+
+# Numba is optional: without it the indicator kernels run as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
 
 # ============================================================================
 # CONFIGURATION
@@ -35,87 +44,202 @@ MACD_SLOW = 26          # Slow EMA for MACD
 MACD_SIGNAL = 9         # Signal line EMA for MACD
 LOOKBACK_DAYS = 100     # Days of historical data to fetch
 
+# Scoring
+MAX_SCORE = 6           # 5 criteria, plus 1 for RSI in the neutral zone
+
+# Data Fetching
+FETCH_MAX_WORKERS = 8   # Threads used for per-ticker fallback downloads
+CACHE_DIR = Path("./.cache")  # Where downloaded OHLCV data is cached
+MARKET_TIMEZONE = 'Asia/Jakarta'  # IDX trading hours are in WIB
+MARKET_CLOSE_TIME = "16:30"   # IDX trading ends ~16:15 WIB; allow for data delay
+
 # ============================================================================
-# HELPER FUNCTIONS FOR TECHNICAL INDICATORS
+# DATA FETCHING
 # ============================================================================
 
-def calculate_rsi(prices, period=14):
+def _load_cached_data(ticker):
     """
-    Calculate Relative Strength Index (RSI).
-    
-    RSI measures momentum and identifies overbought/oversold conditions.
-    - RSI > 70: Stock might be overbought (potential sell signal)
-    - RSI < 30: Stock might be oversold (potential buy signal)
+    Load previously downloaded OHLCV data for a ticker from the local cache.
     
     Args:
-        prices: Pandas Series of closing prices
-        period: Number of periods for RSI calculation (default: 14)
+        ticker: Stock ticker symbol
+    
+    Returns:
+        Pandas DataFrame with cached OHLCV data, or None if there is no cache
+    """
+    cache_path = CACHE_DIR / f"{ticker}.parquet"
+    if not cache_path.exists():
+        return None
+    
+    try:
+        return pd.read_parquet(cache_path, engine='pyarrow')
+    except Exception as e:
+        print(f"Error reading cache for {ticker}: {str(e)}")
+        return None
+
+
+def _last_session_close():
+    """
+    Get the time the most recent IDX trading session closed.
     
     Returns:
-        Pandas Series with RSI values
+        Timezone-aware Timestamp in the exchange's timezone
+    """
+    now = pd.Timestamp.now(tz=MARKET_TIMEZONE)
+    session_close = now.normalize() + pd.Timedelta(f"{MARKET_CLOSE_TIME}:00")
+    if now < session_close:
+        session_close -= pd.Timedelta(days=1)
+    return session_close
+
+
+def _cache_start_date(ticker, cached, start_date):
     """
-    # Calculate price changes
-    delta = prices.diff()
+    Work out where a download should start given what is already cached.
     
-    # Separate gains and losses
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+    The cache counts as up to date only if it was written after the most
+    recent session close. Otherwise the download starts again from the last
+    cached day, so a ticker with a short history (e.g., a recent listing)
+    still only downloads the days it is missing.
     
-    # Calculate Relative Strength
-    rs = gain / loss
+    Args:
+        ticker: Stock ticker symbol
+        cached: Cached DataFrame, or None
+        start_date: Start of the lookback period
     
-    # Calculate RSI
-    rsi = 100 - (100 / (1 + rs))
+    Returns:
+        Date to start downloading from, or None if the cache is up to date
+    """
+    # No cache: fetch everything
+    if cached is None or len(cached) == 0:
+        return start_date
     
-    return rsi
+    cache_path = CACHE_DIR / f"{ticker}.parquet"
+    cached_at = pd.Timestamp(cache_path.stat().st_mtime, unit='s', tz='UTC')
+    if cached_at >= _last_session_close():
+        return None
+    
+    # Download again from the last cached day (or the start of the lookback
+    # period, if the cache ends before it)
+    last_date = cached.index.max().to_pydatetime().replace(tzinfo=None)
+    return max(last_date, start_date)
 
 
-def calculate_macd(prices, fast=12, slow=26, signal=9):
+def _compact_dtypes(data):
     """
-    Calculate MACD (Moving Average Convergence Divergence).
+    Store prices as float32 and volume as int64.
+    
+    float32 is precise enough for IDX prices and halves the memory the
+    indicator calculations have to read.
+    
+    Args:
+        data: DataFrame with OHLCV data
     
-    MACD is a momentum indicator that shows the relationship between two moving averages.
-    - MACD Line: Fast EMA - Slow EMA
-    - Signal Line: 9-period EMA of MACD Line
-    - Histogram: MACD Line - Signal Line
+    Returns:
+        DataFrame with compact column types
+    """
+    dtypes = {
+        column: 'float32'
+        for column in ('Open', 'High', 'Low', 'Close', 'Adj Close')
+        if column in data.columns
+    }
+    # Volume can only be stored as integers when no values are missing
+    if 'Volume' in data.columns and not data['Volume'].isna().any():
+        dtypes['Volume'] = 'int64'
     
-    Trading signals:
-    - Bullish: MACD crosses above Signal Line
-    - Bearish: MACD crosses below Signal Line
+    return data.astype(dtypes)
+
+
+def _update_cache(ticker, cached, new_data, start_date):
+    """
+    Merge newly downloaded rows into the cache and save it to disk.
+    
+    Only bars from completed sessions are kept, so a run during trading
+    hours screens the same bars whether or not a cache already existed.
+    The saved cache is trimmed to the lookback period plus a week, so it
+    does not grow with every run.
     
     Args:
-        prices: Pandas Series of closing prices
-        fast: Period for fast EMA (default: 12)
-        slow: Period for slow EMA (default: 26)
-        signal: Period for signal line EMA (default: 9)
+        ticker: Stock ticker symbol
+        cached: Cached DataFrame, or None
+        new_data: Newly downloaded DataFrame, or None
+        start_date: Start of the lookback period
     
     Returns:
-        Dictionary containing MACD Line, Signal Line, and Histogram
+        Pandas DataFrame covering the lookback period, or None if there is no data
     """
-    # Calculate exponential moving averages
-    ema_fast = prices.ewm(span=fast).mean()
-    ema_slow = prices.ewm(span=slow).mean()
+    frames = [f for f in (cached, new_data) if f is not None and len(f) > 0]
+    if not frames:
+        return None
     
-    # MACD Line
-    macd_line = ema_fast - ema_slow
+    # Newer rows replace cached ones for the same date (e.g., today's partial bar)
+    data = _compact_dtypes(pd.concat(frames))
+    data = data[~data.index.duplicated(keep='last')].sort_index()
     
-    # Signal Line
-    signal_line = macd_line.ewm(span=signal).mean()
+    # Today's bar is partial until the session closes, so leave it out.
+    # A week of slack before the lookback period covers weekends and holidays.
+    last_session = pd.Timestamp(_last_session_close().date())
+    lookback_start = pd.Timestamp(start_date.date())
+    cache_start = lookback_start - pd.Timedelta(days=7)
+    if data.index.tz is not None:
+        last_session = last_session.tz_localize(data.index.tz)
+        lookback_start = lookback_start.tz_localize(data.index.tz)
+        cache_start = cache_start.tz_localize(data.index.tz)
+    data = data[(data.index >= cache_start) & (data.index <= last_session)]
     
-    # MACD Histogram
-    histogram = macd_line - signal_line
+    if new_data is not None and len(new_data) > 0:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            data.to_parquet(CACHE_DIR / f"{ticker}.parquet", engine='pyarrow')
+        except Exception as e:
+            print(f"Error writing cache for {ticker}: {str(e)}")
     
-    return {
-        'macd': macd_line,
-        'signal': signal_line,
-        'histogram': histogram
-    }
+    # Return only the requested lookback period, starting from its first day
+    data = data[data.index >= lookback_start]
+    
+    if len(data) == 0:
+        return None
+    
+    return data
+
+
+def _split_cached(tickers, start_date):
+    """
+    Separate tickers whose cache is up to date from those that need downloading.
+    
+    Args:
+        tickers: List of stock ticker symbols
+        start_date: Start of the lookback period
+    
+    Returns:
+        Tuple of (stock_data, stale_cache, fetch_starts):
+        - stock_data: {ticker: DataFrame} for tickers with an up-to-date cache
+        - stale_cache: {ticker: cached DataFrame or None} for the rest
+        - fetch_starts: {ticker: date to start downloading from} for the rest
+    """
+    stock_data = {}
+    stale_cache = {}
+    fetch_starts = {}
+    
+    for ticker in tickers:
+        cached = _load_cached_data(ticker)
+        fetch_start = _cache_start_date(ticker, cached, start_date)
+        if fetch_start is None:
+            data = _update_cache(ticker, cached, None, start_date)
+            if data is not None:
+                stock_data[ticker] = data
+        else:
+            stale_cache[ticker] = cached
+            fetch_starts[ticker] = fetch_start
+    
+    return stock_data, stale_cache, fetch_starts
 
 
 def fetch_stock_data(ticker, period_days=LOOKBACK_DAYS):
     """
     Fetch historical stock data from Yahoo Finance.
     
+    Data is cached on disk, so only days from the last cached one on are downloaded.
+    
     Args:
         ticker: Stock ticker symbol (e.g., 'BBCA.JK')
         period_days: Number of days of historical data (default: 100)
@@ -128,134 +252,443 @@ def fetch_stock_data(ticker, period_days=LOOKBACK_DAYS):
         end_date = datetime.now()
         start_date = end_date - timedelta(days=period_days)
         
-        # Fetch data
-        data = yf.download(
-            ticker,
-            start=start_date,
-            end=end_date,
-            progress=False  # Don't print progress bar
-        )
+        cached = _load_cached_data(ticker)
+        fetch_start = _cache_start_date(ticker, cached, start_date)
+        if fetch_start is None:
+            return _update_cache(ticker, cached, None, start_date)
+        
+        # Fetch data (history() returns flat columns, unlike yf.download)
+        try:
+            data = yf.Ticker(ticker).history(
+                start=fetch_start,
+                end=end_date,
+                auto_adjust=False,
+                raise_errors=False  # Return an empty frame instead of raising
+            )
+        except Exception as e:
+            print(f"Error fetching data for {ticker}: {str(e)}")
+            data = None
         
-        if len(data) == 0:
-            return None
+        # Nothing new downloaded: fall back to the (out of date) cache, if any
+        if data is None or len(data) == 0:
+            if cached is not None and len(cached) > 0:
+                print(f"Warning: using cached data for {ticker} "
+                      f"(last bar {cached.index.max().date()})")
+            return _update_cache(ticker, cached, None, start_date)
         
-        return data
+        # Keep only OHLCV, labelled by trading date like the other fetchers
+        columns = [c for c in ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume')
+                   if c in data.columns]
+        data = data[columns]
+        if data.index.tz is not None:
+            data.index = data.index.tz_localize(None)
+        data.index = data.index.normalize().rename('Date')
+        
+        return _update_cache(ticker, cached, data, start_date)
     
     except Exception as e:
         print(f"Error fetching data for {ticker}: {str(e)}")
         return None
 
 
+def fetch_stock_data_batch(tickers, period_days=LOOKBACK_DAYS):
+    """
+    Fetch historical stock data for many tickers in a single request.
+    
+    Yahoo Finance accepts a space-separated list of symbols, so one call
+    replaces a separate download (and rate-limit pause) per ticker.
+    Tickers with an up-to-date cache are not downloaded at all, and the
+    rest only download from the last day in their cache. Tickers the
+    download returns nothing for are left out, so the caller can retry them
+    one by one.
+    
+    Args:
+        tickers: List of stock ticker symbols (e.g., ['BBCA.JK', 'BBRI.JK'])
+        period_days: Number of days of historical data (default: 100)
+    
+    Returns:
+        Dictionary mapping ticker to its DataFrame (tickers without data are left out)
+    """
+    # Calculate date range
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=period_days)
+    
+    stock_data, stale_cache, fetch_starts = _split_cached(tickers, start_date)
+    if not stale_cache:
+        return stock_data
+    
+    try:
+        # Fetch all remaining tickers at once, grouped so data[ticker] gives OHLCV
+        data = yf.download(
+            " ".join(stale_cache),
+            start=min(fetch_starts.values()),
+            end=end_date,
+            progress=False,  # Don't print progress bar
+            group_by='ticker',
+            threads=True,
+            auto_adjust=False
+        )
+    except Exception as e:
+        print(f"Error fetching batch data: {str(e)}")
+        data = None
+    
+    if data is None or len(data) == 0:
+        return stock_data
+    
+    for ticker, cached in stale_cache.items():
+        # Take this stock's slice of the batch (rows where it did not trade are all NaN)
+        try:
+            new_data = data[ticker].dropna(how='all')
+        except KeyError:
+            continue
+        if len(new_data) == 0:
+            continue
+        
+        ticker_data = _update_cache(ticker, cached, new_data, start_date)
+        if ticker_data is not None:
+            stock_data[ticker] = ticker_data
+    
+    return stock_data
+
+
+def fetch_stock_data_parallel(tickers, max_workers=FETCH_MAX_WORKERS):
+    """
+    Fetch historical stock data for many tickers using a thread pool.
+    
+    Each ticker is downloaded with fetch_stock_data() on its own thread.
+    Downloads spend most of their time waiting on the network, so several
+    can run at the same time.
+    
+    Args:
+        tickers: List of stock ticker symbols
+        max_workers: Number of download threads (default: 8)
+    
+    Returns:
+        Dictionary mapping ticker to its DataFrame (failed fetches are left out)
+    """
+    stock_data = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_stock_data, t): t for t in tickers}
+        
+        for future in as_completed(futures):
+            data = future.result()
+            if data is not None:
+                stock_data[futures[future]] = data
+    
+    return stock_data
+
+
+# ============================================================================
+# HELPER FUNCTIONS FOR TECHNICAL INDICATORS
+# ============================================================================
+
+@njit(cache=True)
+def _latest_mean(values, window):
+    """
+    Calculate the simple moving average of the most recent `window` values.
+    
+    Only the latest value is needed, so this averages the last slice instead
+    of building a full rolling series.
+    
+    Args:
+        values: NumPy float array
+        window: Number of periods to average
+    
+    Returns:
+        Average of the last `window` values, or NaN if there is not enough data
+    """
+    if len(values) < window:
+        return np.nan
+    return values[-window:].mean()
+
+
 # ============================================================================
 # SCREENING LOGIC
 # ============================================================================
 
-def screen_stock(ticker, data):
+@dataclass
+class Signals:
+    """
+    Latest indicator values and swing trading score for one stock.
+    
+    Uses __slots__ instead of a per-instance dict, which keeps each result
+    small and fast to create when screening many stocks.
+    """
+    __slots__ = (
+        'ticker', 'price', 'rsi', 'macd', 'signal_line', 'histogram',
+        'sma_20', 'sma_50', 'sma_200', 'volume', 'avg_volume', 'score', 'reasons',
+    )
+    
+    ticker: str
+    price: float
+    rsi: float
+    macd: float
+    signal_line: float
+    histogram: float
+    sma_20: float
+    sma_50: float
+    sma_200: float
+    volume: float
+    avg_volume: float
+    score: int
+    reasons: list
+
+
+def _stack_right_aligned(arrays, dtype=np.float32):
+    """
+    Stack 1-D arrays of different lengths into one 2-D array.
+    
+    Each array becomes a column, aligned on its last (most recent) value.
+    Shorter columns are padded at the top with their first value, which
+    leaves an EMA seeded from that value unchanged.
+    
+    Args:
+        arrays: List of 1-D NumPy arrays
+        dtype: dtype of the stacked array (default: float32)
+    
+    Returns:
+        Tuple of (stacked array with shape (longest length, len(arrays)),
+        NumPy array with each column's original length)
+    """
+    counts = np.array([len(a) for a in arrays], dtype=np.int64)
+    stacked = np.empty((counts.max(), len(arrays)), dtype=dtype)
+    for column, values in enumerate(arrays):
+        pad = stacked.shape[0] - len(values)
+        stacked[:pad, column] = values[0]
+        stacked[pad:, column] = values
+    
+    return stacked, counts
+
+
+@njit(cache=True)
+def _latest_indicators_soa(closes, volumes, counts, rsi_period, fast, slow, signal):
+    """
+    Calculate the latest RSI, MACD, moving averages and average volume for
+    many stocks at once.
+    
+    Walks the bars once, carrying running state for every stock instead of
+    building a full-length series for each:
+    - RSI: Wilder's smoothed average gain/loss
+    - MACD: recursive fast, slow and signal EMAs
+    - SMAs (20/50/200) and 20-day average volume: mean of the last N values
+    Each bar is one contiguous row across all stocks, so the inner loop over
+    stocks can be vectorized.
+    
+    Args:
+        closes: 2-D array of closing prices with shape (bars, stocks), from
+            _stack_right_aligned()
+        volumes: 2-D array of volumes laid out like `closes`
+        counts: Number of real (unpadded) bars for each stock
+        rsi_period: Number of periods for RSI
+        fast: Period for fast EMA
+        slow: Period for slow EMA
+        signal: Period for signal line EMA
+    
+    Returns:
+        Tuple of arrays (rsi, macd, signal_line, histogram, sma_20, sma_50,
+        sma_200, avg_volume), one value per stock. Values without enough
+        data are NaN.
+    """
+    num_bars, num_stocks = closes.shape
+    
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_signal = 2.0 / (signal + 1)
+    
+    # Running state, accumulated in float64 even though prices are float32
+    ema_fast = np.empty(num_stocks)
+    ema_slow = np.empty(num_stocks)
+    ema_signal = np.zeros(num_stocks)
+    avg_gain = np.zeros(num_stocks)
+    avg_loss = np.zeros(num_stocks)
+    for s in range(num_stocks):
+        ema_fast[s] = closes[0, s]
+        ema_slow[s] = closes[0, s]
+    
+    for i in range(1, num_bars):
+        for s in range(num_stocks):
+            price = float(closes[i, s])
+            
+            # MACD: padded bars repeat the first price, so the EMAs stay at their seed
+            ema_fast[s] = alpha_fast * price + (1 - alpha_fast) * ema_fast[s]
+            ema_slow[s] = alpha_slow * price + (1 - alpha_slow) * ema_slow[s]
+            ema_signal[s] = (alpha_signal * (ema_fast[s] - ema_slow[s])
+                             + (1 - alpha_signal) * ema_signal[s])
+            
+            # RSI: simple average of the first period, Wilder smoothing after,
+            # counted from each stock's first real bar
+            bar = i - (num_bars - counts[s])
+            change = price - float(closes[i - 1, s])
+            gain = max(change, 0.0)
+            loss = -min(change, 0.0)
+            if 1 <= bar <= rsi_period:
+                avg_gain[s] += gain / rsi_period
+                avg_loss[s] += loss / rsi_period
+            elif bar > rsi_period:
+                avg_gain[s] = (avg_gain[s] * (rsi_period - 1) + gain) / rsi_period
+                avg_loss[s] = (avg_loss[s] * (rsi_period - 1) + loss) / rsi_period
+    
+    rsi = np.empty(num_stocks)
+    sma_20 = np.empty(num_stocks)
+    sma_50 = np.empty(num_stocks)
+    sma_200 = np.empty(num_stocks)
+    avg_volume = np.empty(num_stocks)
+    for s in range(num_stocks):
+        if counts[s] <= rsi_period:
+            rsi[s] = np.nan
+        elif avg_loss[s] == 0:
+            rsi[s] = 100.0
+        else:
+            rsi[s] = 100 - (100 / (1 + avg_gain[s] / avg_loss[s]))
+        
+        first = num_bars - counts[s]
+        sma_20[s] = _latest_mean(closes[first:, s], 20)
+        sma_50[s] = _latest_mean(closes[first:, s], 50)
+        sma_200[s] = _latest_mean(closes[first:, s], 200)
+        avg_volume[s] = _latest_mean(volumes[first:, s], 20)
+    
+    macd = ema_fast - ema_slow
+    
+    return (rsi, macd, ema_signal, macd - ema_signal,
+            sma_20, sma_50, sma_200, avg_volume)
+
+
+def screen_stocks(tickers, close_arrays, volume_arrays):
+    """
+    Calculate the latest indicator values for many stocks at once.
+    
+    All stocks are stacked into 2-D arrays and screened together by
+    _latest_indicators_soa(). Results stay as one array per value, so
+    score_stocks() can check every stock at once.
+    
+    Args:
+        tickers: List of stock ticker symbols
+        close_arrays: List of NumPy arrays of closing prices, one per ticker
+        volume_arrays: List of NumPy arrays of volumes, one per ticker
+    
+    Returns:
+        Dictionary mapping each Signals field (ticker to avg_volume) to a
+        NumPy array with one value per stock (empty if there are no tickers)
+    """
+    if not tickers:
+        return {}
+    
+    closes, counts = _stack_right_aligned(close_arrays)
+    volumes, _ = _stack_right_aligned(volume_arrays, dtype=np.float64)
+    (rsi, macd, signal_line, histogram,
+     sma_20, sma_50, sma_200, avg_volume) = _latest_indicators_soa(
+        closes, volumes, counts, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL
+    )
+    
+    # The last row holds every stock's most recent bar
+    return {
+        'ticker': np.array(tickers),
+        'price': closes[-1].astype(np.float64),
+        'rsi': rsi,
+        'macd': macd,
+        'signal_line': signal_line,
+        'histogram': histogram,
+        'sma_20': sma_20,
+        'sma_50': sma_50,
+        'sma_200': sma_200,
+        'volume': volumes[-1],
+        'avg_volume': avg_volume,
+    }
+
+
+def score_stocks(indicators):
     """
-    Screen a single stock based on swing trading criteria.
+    Score stocks based on swing trading criteria.
     
     Beginner-friendly criteria:
     1. RSI between 40-60: Neutral zone, safe for swing trades
     2. MACD histogram positive: Momentum is upward
-    3. Price above 200-day simple moving average: In uptrend
-    4. Recent volume higher than average: Increased interest
+    3. MACD above signal line: Bullish crossover
+    4. Price above 20-day and 50-day simple moving averages: In uptrend
+    
+    Each criterion is checked for every stock at once with NumPy comparisons,
+    then one Signals is built per stock with its score and reasons.
     
     Args:
-        ticker: Stock ticker symbol
-        data: DataFrame with OHLCV data
+        indicators: Dictionary of per-stock value arrays from screen_stocks()
     
     Returns:
-        Dictionary with screening results, or None if screening fails
+        List of Signals, one per stock
     """
-    try:
-        # Ensure we have enough data
-        if len(data) < RSI_PERIOD:
-            return None
-        
-        # Calculate technical indicators
-        close_prices = data['Close']
-        rsi = calculate_rsi(close_prices, RSI_PERIOD)
-        macd_data = calculate_macd(close_prices, MACD_FAST, MACD_SLOW, MACD_SIGNAL)
-        
-        # Calculate moving averages
-        sma_20 = close_prices.rolling(window=20).mean()
-        sma_50 = close_prices.rolling(window=50).mean()
-        sma_200 = close_prices.rolling(window=200).mean()
-        
-        # Get the most recent values
-        latest_idx = -1
-        current_price = close_prices.iloc[latest_idx]
-        current_rsi = rsi.iloc[latest_idx]
-        current_macd = macd_data['macd'].iloc[latest_idx]
-        current_signal = macd_data['signal'].iloc[latest_idx]
-        current_histogram = macd_data['histogram'].iloc[latest_idx]
-        current_sma_20 = sma_20.iloc[latest_idx]
-        current_sma_50 = sma_50.iloc[latest_idx]
-        current_sma_200 = sma_200.iloc[latest_idx]
-        
-        # Calculate average volume
-        avg_volume = data['Volume'].rolling(window=20).mean().iloc[latest_idx]
-        current_volume = data['Volume'].iloc[latest_idx]
-        
-        # ====================================================================
-        # SWING TRADING CRITERIA FOR BEGINNERS
-        # ====================================================================
-        
-        signals = {
-            'ticker': ticker,
-            'price': current_price,
-            'rsi': current_rsi,
-            'macd': current_macd,
-            'signal_line': current_signal,
-            'histogram': current_histogram,
-            'sma_20': current_sma_20,
-            'sma_50': current_sma_50,
-            'sma_200': current_sma_200,
-            'volume': current_volume,
-            'avg_volume': avg_volume,
-        }
-        
-        # Scoring system (0-5 points)
-        score = 0
+    if not indicators:
+        return []
+    
+    price = indicators['price']
+    rsi = indicators['rsi']
+    macd = indicators['macd']
+    signal_line = indicators['signal_line']
+    histogram = indicators['histogram']
+    sma_20 = indicators['sma_20']
+    sma_50 = indicators['sma_50']
+    
+    # ========================================================================
+    # SWING TRADING CRITERIA FOR BEGINNERS
+    # ========================================================================
+    
+    # Criterion 1: RSI in favorable zone (30-70, neutral: 40-60)
+    rsi_trading_zone = (30 < rsi) & (rsi < 70)
+    rsi_neutral_zone = rsi_trading_zone & (40 < rsi) & (rsi < 60)
+    
+    # Criterion 2: MACD positive histogram (bullish momentum)
+    histogram_positive = histogram > 0
+    
+    # Criterion 3: MACD above signal line
+    macd_above_signal = macd > signal_line
+    
+    # Criterion 4: Price above 20-day SMA (short-term uptrend)
+    above_sma_20 = price > sma_20
+    
+    # Criterion 5: Price above 50-day SMA (medium-term uptrend)
+    above_sma_50 = price > sma_50
+    
+    # Scoring system (0-MAX_SCORE points: 1 per criterion, plus 1 for the
+    # RSI neutral zone)
+    scores = (rsi_trading_zone.astype(np.int64) + rsi_neutral_zone
+              + histogram_positive + macd_above_signal
+              + above_sma_20 + above_sma_50)
+    
+    # Convert each array to Python values once, for building the results
+    values = {name: column.tolist() for name, column in indicators.items()}
+    
+    results = []
+    for i, ticker in enumerate(values['ticker']):
         reasons = []
-        
-        # Criterion 1: RSI in favorable zone (30-70, neutral: 40-60)
-        if 30 < current_rsi < 70:
-            score += 1
-            if 40 < current_rsi < 60:
-                score += 1
-                reasons.append(f"RSI {current_rsi:.1f} in neutral zone (40-60)")
-            else:
-                reasons.append(f"RSI {current_rsi:.1f} in trading zone (30-70)")
-        
-        # Criterion 2: MACD positive histogram (bullish momentum)
-        if current_histogram > 0:
-            score += 1
+        if rsi_neutral_zone[i]:
+            reasons.append(f"RSI {values['rsi'][i]:.1f} in neutral zone (40-60)")
+        elif rsi_trading_zone[i]:
+            reasons.append(f"RSI {values['rsi'][i]:.1f} in trading zone (30-70)")
+        if histogram_positive[i]:
             reasons.append("MACD histogram positive (bullish)")
-        
-        # Criterion 3: MACD above signal line
-        if current_macd > current_signal:
-            score += 1
+        if macd_above_signal[i]:
             reasons.append("MACD above signal line")
-        
-        # Criterion 4: Price above 20-day SMA (short-term uptrend)
-        if current_price > current_sma_20:
-            score += 1
+        if above_sma_20[i]:
             reasons.append("Price above 20-day SMA (short-term uptrend)")
-        
-        # Criterion 5: Price above 50-day SMA (medium-term uptrend)
-        if current_price > current_sma_50:
-            score += 1
+        if above_sma_50[i]:
             reasons.append("Price above 50-day SMA (medium-term uptrend)")
         
-        signals['score'] = score
-        signals['reasons'] = reasons
-        
-        return signals
+        results.append(Signals(
+            ticker=ticker,
+            price=values['price'][i],
+            rsi=values['rsi'][i],
+            macd=values['macd'][i],
+            signal_line=values['signal_line'][i],
+            histogram=values['histogram'][i],
+            sma_20=values['sma_20'][i],
+            sma_50=values['sma_50'][i],
+            sma_200=values['sma_200'][i],
+            volume=values['volume'][i],
+            avg_volume=values['avg_volume'][i],
+            score=int(scores[i]),
+            reasons=reasons,
+        ))
     
-    except Exception as e:
-        print(f"Error screening {ticker}: {str(e)}")
-        return None
+    return results
 
 
 # ============================================================================
@@ -276,32 +709,47 @@ def run_screener():
     print("=" * 80)
     print()
     
-    results = []
+    # Fetch data for all stocks in one request (cached days are not re-downloaded)
+    stock_data = fetch_stock_data_batch(INDONESIAN_STOCKS)
+    
+    # Fall back to single-ticker fetches (e.g., delisted or missing symbols)
+    missing_tickers = [t for t in INDONESIAN_STOCKS if t not in stock_data]
+    if missing_tickers:
+        stock_data.update(fetch_stock_data_parallel(missing_tickers))
     
-    # Screen each stock
+    # Check each stock has enough data to screen
+    screen_tickers = []
+    close_arrays = []
+    volume_arrays = []
     for i, ticker in enumerate(INDONESIAN_STOCKS, 1):
         print(f"[{i}/{len(INDONESIAN_STOCKS)}] Screening {ticker}...", end=" ")
         
-        # Fetch data
-        data = fetch_stock_data(ticker)
+        data = stock_data.get(ticker)
         if data is None:
             print("FAILED TO FETCH DATA")
             continue
         
-        # Screen stock
-        signals = screen_stock(ticker, data)
-        if signals is None:
+        close_prices = data['Close'].to_numpy(dtype=np.float32)
+        if len(close_prices) < RSI_PERIOD:
             print("FAILED TO SCREEN")
             continue
         
-        results.append(signals)
+        screen_tickers.append(ticker)
+        close_arrays.append(close_prices)
+        # Volumes stay float64: float32 is only exact up to ~16.7M shares
+        volume_arrays.append(data['Volume'].to_numpy(dtype=np.float64))
         print("OK")
-        
-        # Be respectful to API rate limits
-        time.sleep(0.5)
+    
+    # Screen and score all stocks at once
+    indicators = screen_stocks(screen_tickers, close_arrays, volume_arrays)
+    results = score_stocks(indicators)
     
     # Sort results by score (highest first)
-    results.sort(key=lambda x: x['score'], reverse=True)
+    # Build the table column by column (no per-result dict copies)
+    results_table = pd.DataFrame(
+        {f.name: [getattr(r, f.name) for r in results] for f in fields(Signals)}
+    )
+    results_table = results_table.sort_values('score', ascending=False, kind='stable')
     
     # Display results
     print()
@@ -310,23 +758,33 @@ def run_screener():
     print("=" * 80)
     print()
     
-    for result in results:
-        score_display = "★" * result['score'] + "☆" * (5 - result['score'])
-        
-        print(f"Ticker: {result['ticker']}")
-        print(f"Price: {result['price']:.2f} | Score: {result['score']}/5 {score_display}")
-        print(f"RSI: {result['rsi']:.1f} | MACD Histogram: {result['histogram']:.4f}")
-        print(f"Reasons:")
-        for reason in result['reasons']:
-            print(f"  • {reason}")
+    # Render the numeric columns in one pass, then print each stock's
+    # reasons underneath its row so the output stays within 80 columns
+    if len(results_table) > 0:
+        table = results_table[['ticker', 'price', 'score', 'rsi', 'histogram']]
+        header, *rows = table.to_string(
+            index=False,
+            formatters={
+                'price': '{:.2f}'.format,
+                'score': lambda score: (f"{score}/{MAX_SCORE} " + "★" * score
+                                        + "☆" * (MAX_SCORE - score)),
+                'rsi': '{:.1f}'.format,
+                'histogram': '{:.4f}'.format,
+            }
+        ).splitlines()
+        print(header.rstrip())
+        for row, reasons in zip(rows, results_table['reasons']):
+            print(row.rstrip())
+            for reason in reasons:
+                print(f"    - {reason}")
         print("-" * 80)
     
     print()
-    print(f"Total stocks screened: {len(results)}")
+    print(f"Total stocks screened: {len(results_table)}")
     print("Strong candidates (score >= 4):")
-    strong_candidates = [r for r in results if r['score'] >= 4]
-    for candidate in strong_candidates:
-        print(f"  • {candidate['ticker']} (Score: {candidate['score']}/5)")
+    strong_candidates = results_table[results_table['score'] >= 4]
+    for ticker, score in zip(strong_candidates['ticker'], strong_candidates['score']):
+        print(f"  • {ticker} (Score: {score}/{MAX_SCORE})")
     
     print()
     print("=" * 80)